@@ -53,6 +53,8 @@ class ContainerManager:
             extra_args.append("--force-recreate")
 
         cmd = build_compose_command(self.config, "up", extra_args)
+        # A previous stop() (e.g. from restart) must not cut this run's output short
+        self._stop_requested = False
 
         try:
             if detached:
@@ -213,6 +215,7 @@ def start_container_async(
     output_callback: Callable[[str], None] = None,
     started_callback: Callable[[], None] = None,
     completion_callback: Callable[[bool], None] = None,
+    manager: Optional[ContainerManager] = None,
 ):
     """
     Start container in a background thread (for GUI).
@@ -223,10 +226,12 @@ def start_container_async(
         output_callback: Function to call with output lines
         started_callback: Called once when launcher log shows startup success (GUI up)
         completion_callback: Called when the container process exits; argument is (returncode == 0)
+        manager: Existing manager to start with, so the caller can reuse it for stop/restart
     """
+    if manager is None:
+        manager = ContainerManager(config)
 
     def _worker():
-        manager = ContainerManager(config)
         success = manager.start(
             detached=detached, output_callback=output_callback, started_callback=started_callback
         )
@@ -3,22 +3,102 @@ GUI interface for Minecraft Launcher.
 Provides graphical Tkinter-based interaction.
 """
 
+import collections
+import os
+import subprocess
 import threading
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from tkinter import messagebox, scrolledtext, ttk
-from typing import Dict
+from tkinter import messagebox, ttk
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from core.composer import get_command_preview
-from core.config import load_config, merge_config, save_config
+from core.config import CONFIG_DIR, CONFIG_FILE, load_config, merge_config, save_config
 from core.container import ContainerManager, start_container_async
 from core.detector import detect_system, get_detection_details
 from core.validator import run_xhost_if_needed, validate_system
 
+# Window icon shipped next to this module
+_ICON_PATH = Path(__file__).parent / "icon.png"
+_ICON_EXISTS = _ICON_PATH.is_file()
+
+# Tk 8.6+ decodes PNG natively; only older builds need the Pillow fallback for icon.png
+_TK_PNG_SUPPORTED = tk.TkVersion >= 8.6
+# Pillow import result, probed once on first need (None = not probed yet)
+_PIL_AVAILABLE = None
+
+
+def _pil_available() -> bool:
+    """Return whether Pillow can be imported, trying the import only once per process."""
+    global _PIL_AVAILABLE
+    if _PIL_AVAILABLE is None:
+        try:
+            import PIL.ImageTk  # noqa: F401
+
+            _PIL_AVAILABLE = True
+        except ImportError:
+            _PIL_AVAILABLE = False
+    return _PIL_AVAILABLE
+
 
 class MinecraftLauncherGUI:
     """Main GUI application for Minecraft Launcher."""
 
+    # Console history is trimmed to this many lines to bound memory and insert cost
+    MAX_LOG_LINES = 5000
+
+    # Seconds Doctor reuses detection details; short so fixes on the host show up on rerun
+    DETECTION_CACHE_TTL = 10.0
+
+    # Decoded window icon, shared across instances so icon.png is decoded once
+    _icon_photo_cache: Optional[tk.PhotoImage] = None
+
+    # Configuration dropdowns: (config key, label, choices)
+    _FIELD_SPEC = (
+        ("runtime", "Runtime", ("auto", "podman", "docker")),
+        ("gpu", "GPU", ("auto", "nvidia", "amd")),
+        ("display", "Display", ("auto", "x11", "wayland")),
+        ("audio", "Audio", ("auto", "pulseaudio", "none")),
+    )
+
+    # Color palette - Minecraft-inspired greens and modern grays
+    _PALETTE = {
+        "bg": "#2b2b2b",  # Dark gray background
+        "fg": "#e8e8e8",  # Light text
+        "accent": "#7cbd3f",  # Minecraft grass green
+        "success": "#4caf50",
+        "warning": "#ff9800",
+        "error": "#f44336",
+        "info": "#2196f3",
+    }
+
+    # Status label color names
+    _COLOR_MAP = {
+        "success": _PALETTE["success"],
+        "green": _PALETTE["success"],
+        "warning": _PALETTE["warning"],
+        "orange": _PALETTE["warning"],
+        "error": _PALETTE["error"],
+        "red": _PALETTE["error"],
+        "info": _PALETTE["info"],
+        "gray": "#888888",
+        "black": _PALETTE["fg"],
+    }
+
+    # Status indicator glyph per status key
+    _STATUS_GLYPHS = {
+        "running": "●",
+        "starting": "◐",
+        "stopping": "◐",
+        "restarting": "◐",
+        "stopped": "○",
+        "ready": "○",
+        "failed": "✗",
+        "error": "✗",
+    }
+
     def __init__(self):
         """Initialize the GUI."""
         self.window = tk.Tk()
@@ -47,14 +127,28 @@ class MinecraftLauncherGUI:
         self._monitor_enabled = False
         self._monitor_job = None
         self._container_pid = None
+        self._log_queue: Deque[Tuple[str, Optional[str]]] = collections.deque()
+        self._log_flush_scheduled = False
+        # Plain-text copy of the console (same cap as the widget) for copy_logs
+        self._log_buffer: Deque[str] = collections.deque(maxlen=self.MAX_LOG_LINES)
+        self._last_log_paint = 0.0
+        self._config_cache = None
+        self._detection_details_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._detection_details_time = 0.0
 
         # Get CPU core count for normalizing stats
-        import os
-
         self._cpu_cores = os.cpu_count() or 1
 
+        # Reused worker threads for stop/restart (bounded, unlike a thread per click)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mcl-worker")
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
+
         self._create_widgets()
-        self._detect_and_load()
+        # Handlers need detection results; _apply_detection enables these
+        for btn in (self.btn_start, self.btn_doctor, self.btn_save):
+            btn.config(state=tk.DISABLED)
+        # Let the window paint before running (slow) system detection
+        self.window.after(50, self._detect_and_load)
 
     def _setup_theme(self):
         """Set up modern theme and colors."""
@@ -63,66 +157,82 @@ class MinecraftLauncherGUI:
         # Try to use a better theme if available
         available_themes = style.theme_names()
         if "clam" in available_themes:
-            style.theme_use("clam")
+            theme = "clam"
         elif "alt" in available_themes:
-            style.theme_use("alt")
+            theme = "alt"
+        else:
+            theme = style.theme_use()
 
-        # Custom color scheme - Minecraft-inspired greens and modern grays
-        bg_color = "#2b2b2b"  # Dark gray background
-        fg_color = "#e8e8e8"  # Light text
-        accent_color = "#7cbd3f"  # Minecraft grass green
+        # Custom color scheme (see _PALETTE)
+        bg_color = self._PALETTE["bg"]
+        fg_color = self._PALETTE["fg"]
+        accent_color = self._PALETTE["accent"]
         button_bg = "#3d3d3d"  # Button background
         button_active = "#4a4a4a"  # Button hover
 
         # Configure window background
         self.window.configure(bg=bg_color)
 
-        # Configure styles
-        style.configure("TFrame", background=bg_color)
-        style.configure("TLabel", background=bg_color, foreground=fg_color, font=("Segoe UI", 10))
-        style.configure(
-            "TLabelframe", background=bg_color, foreground=fg_color, bordercolor=accent_color
-        )
-        style.configure(
-            "TLabelframe.Label",
-            background=bg_color,
-            foreground=accent_color,
-            font=("Segoe UI", 10, "bold"),
-        )
-
-        # Button styling
-        style.configure(
-            "TButton",
-            background=button_bg,
-            foreground=fg_color,
-            bordercolor=accent_color,
-            focuscolor=accent_color,
-            font=("Segoe UI", 9),
-            padding=8,
-        )
-        style.map(
-            "TButton",
-            background=[("active", button_active), ("pressed", accent_color)],
-            foreground=[("active", fg_color)],
-        )
-
-        # Combobox styling
-        style.configure(
-            "TCombobox",
-            fieldbackground=button_bg,
-            background=button_bg,
-            foreground=fg_color,
-            arrowcolor=accent_color,
-            selectbackground=accent_color,
-            selectforeground=fg_color,
-        )
-
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", button_bg)],
-            selectbackground=[("readonly", accent_color)],
-            selectforeground=[("readonly", fg_color)],
+        # Configure all styles in one theme_settings call instead of one per style
+        style.theme_settings(
+            theme,
+            {
+                "TFrame": {"configure": {"background": bg_color}},
+                "TLabel": {
+                    "configure": {
+                        "background": bg_color,
+                        "foreground": fg_color,
+                        "font": ("Segoe UI", 10),
+                    }
+                },
+                "TLabelframe": {
+                    "configure": {
+                        "background": bg_color,
+                        "foreground": fg_color,
+                        "bordercolor": accent_color,
+                    }
+                },
+                "TLabelframe.Label": {
+                    "configure": {
+                        "background": bg_color,
+                        "foreground": accent_color,
+                        "font": ("Segoe UI", 10, "bold"),
+                    }
+                },
+                # Button styling
+                "TButton": {
+                    "configure": {
+                        "background": button_bg,
+                        "foreground": fg_color,
+                        "bordercolor": accent_color,
+                        "focuscolor": accent_color,
+                        "font": ("Segoe UI", 9),
+                        "padding": 8,
+                    },
+                    "map": {
+                        "background": [("active", button_active), ("pressed", accent_color)],
+                        "foreground": [("active", fg_color)],
+                    },
+                },
+                # Combobox styling
+                "TCombobox": {
+                    "configure": {
+                        "fieldbackground": button_bg,
+                        "background": button_bg,
+                        "foreground": fg_color,
+                        "arrowcolor": accent_color,
+                        "selectbackground": accent_color,
+                        "selectforeground": fg_color,
+                    },
+                    "map": {
+                        "fieldbackground": [("readonly", button_bg)],
+                        "selectbackground": [("readonly", accent_color)],
+                        "selectforeground": [("readonly", fg_color)],
+                    },
+                },
+            },
         )
+        style.theme_use(theme)
 
         # Configure combobox dropdown listbox colors
         self.window.option_add("*TCombobox*Listbox.background", button_bg)
@@ -132,35 +242,45 @@ class MinecraftLauncherGUI:
         self.window.option_add("*TCombobox*Listbox.font", ("Segoe UI", 10))
 
         # Configure colors for status labels
-        self.colors = {
-            "bg": bg_color,
-            "fg": fg_color,
-            "accent": accent_color,
-            "success": "#4caf50",
-            "warning": "#ff9800",
-            "error": "#f44336",
-            "info": "#2196f3",
-        }
+        self.colors = dict(self._PALETTE)
 
     def _set_window_icon(self):
         """Set the window icon for taskbar/dock (X11). Keeps a reference to avoid GC."""
-        icon_path = Path(__file__).parent / "icon.png"
-        if not icon_path.is_file():
+        cls = type(self)
+        if cls._icon_photo_cache is not None:
+            try:
+                self._icon_photo = cls._icon_photo_cache
+                self.window.iconphoto(True, self._icon_photo)
+                return
+            except tk.TclError:
+                # Cached image belongs to a destroyed Tk interpreter; decode again
+                cls._icon_photo_cache = None
+
+        if not _ICON_EXISTS:
             return
-        try:
-            # Try standard Tk PhotoImage (PNG supported on many Linux Tk builds)
-            self._icon_photo = tk.PhotoImage(file=str(icon_path))
-            self.window.iconphoto(True, self._icon_photo)
-        except tk.TclError:
+        icon_path = _ICON_PATH
+        photo = None
+        if _TK_PNG_SUPPORTED:
+            try:
+                photo = tk.PhotoImage(file=str(icon_path))
+            except tk.TclError:
+                pass
+        if photo is None and _pil_available():
             try:
                 # Fallback: Pillow if installed
                 from PIL import Image, ImageTk
 
-                img = Image.open(icon_path)
-                self._icon_photo = ImageTk.PhotoImage(img)
-                self.window.iconphoto(True, self._icon_photo)
-            except (ImportError, OSError):
+                photo = ImageTk.PhotoImage(Image.open(icon_path))
+            except OSError:
                 pass
+        if photo is None:
+            return
+        try:
+            self.window.iconphoto(True, photo)
+        except tk.TclError:
+            return
+        self._icon_photo = photo
+        cls._icon_photo_cache = photo
 
     def _create_widgets(self):
         """Create all GUI widgets."""
@@ -205,80 +325,36 @@ class MinecraftLauncherGUI:
         detect_frame = ttk.LabelFrame(left_frame, text="⚙ Configuration", padding="12")
         detect_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 12))
 
-        # Runtime
-        ttk.Label(detect_frame, text="Runtime:", font=("Segoe UI", 10)).grid(
-            row=0, column=0, sticky=tk.W, padx=(0, 8)
-        )
-        self.runtime_var = tk.StringVar()
-        self.runtime_combo = ttk.Combobox(
-            detect_frame,
-            textvariable=self.runtime_var,
-            values=["auto", "podman", "docker"],
-            state="readonly",
-            width=14,
-        )
-        self.runtime_combo.grid(row=0, column=1, sticky=tk.W, padx=(0, 20))
-        self.runtime_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
-        self.runtime_status_label.grid(row=0, column=2, sticky=tk.W)
+        # One label/combobox/detected-value label per field, two fields per row.
+        # Variables and detected-value labels are kept in self._field_widgets
+        field_widgets = []
+        for index, (key, label, values) in enumerate(self._FIELD_SPEC):
+            row, col = divmod(index, 2)
+            col *= 3
+            pady = (10, 0) if row else 0
 
-        # GPU
-        ttk.Label(detect_frame, text="GPU:", font=("Segoe UI", 10)).grid(
-            row=0, column=3, sticky=tk.W, padx=(0, 8)
-        )
-        self.gpu_var = tk.StringVar()
-        self.gpu_combo = ttk.Combobox(
-            detect_frame,
-            textvariable=self.gpu_var,
-            values=["auto", "nvidia", "amd"],
-            state="readonly",
-            width=14,
-        )
-        self.gpu_combo.grid(row=0, column=4, sticky=tk.W, padx=(0, 20))
-        self.gpu_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
-        self.gpu_status_label.grid(row=0, column=5, sticky=tk.W)
+            ttk.Label(detect_frame, text=f"{label}:", font=("Segoe UI", 10)).grid(
+                row=row, column=col, sticky=tk.W, padx=(0, 8), pady=pady
+            )
+            var = tk.StringVar()
+            combo = ttk.Combobox(
+                detect_frame, textvariable=var, values=values, state="readonly", width=14
+            )
+            combo.grid(row=row, column=col + 1, sticky=tk.W, pady=pady, padx=(0, 20))
+            status_label = ttk.Label(detect_frame, text="", foreground="gray", font=("Segoe UI", 8))
+            status_label.grid(row=row, column=col + 2, sticky=tk.W, pady=pady)
 
-        # Display
-        ttk.Label(detect_frame, text="Display:", font=("Segoe UI", 10)).grid(
-            row=1, column=0, sticky=tk.W, padx=(0, 8), pady=(10, 0)
-        )
-        self.display_var = tk.StringVar()
-        self.display_combo = ttk.Combobox(
-            detect_frame,
-            textvariable=self.display_var,
-            values=["auto", "x11", "wayland"],
-            state="readonly",
-            width=14,
-        )
-        self.display_combo.grid(row=1, column=1, sticky=tk.W, pady=(10, 0), padx=(0, 20))
-        self.display_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
-        self.display_status_label.grid(row=1, column=2, sticky=tk.W, pady=(10, 0))
-
-        # Audio
-        ttk.Label(detect_frame, text="Audio:", font=("Segoe UI", 10)).grid(
-            row=1, column=3, sticky=tk.W, padx=(0, 8), pady=(10, 0)
-        )
-        self.audio_var = tk.StringVar()
-        self.audio_combo = ttk.Combobox(
-            detect_frame,
-            textvariable=self.audio_var,
-            values=["auto", "pulseaudio", "none"],
-            state="readonly",
-            width=14,
-        )
-        self.audio_combo.grid(row=1, column=4, sticky=tk.W, pady=(10, 0), padx=(0, 20))
-        self.audio_status_label = ttk.Label(
-            detect_frame, text="", foreground="gray", font=("Segoe UI", 8)
-        )
-        self.audio_status_label.grid(row=1, column=5, sticky=tk.W, pady=(10, 0))
+            field_widgets.append((key, var, status_label))
 
         detect_frame.columnconfigure(5, weight=1)
 
+        # (key, variable, status label) per config field, for table-driven updates
+        self._field_widgets = tuple(field_widgets)
+
+        # Invalidate the cached config whenever a dropdown changes
+        for _key, var, _label in self._field_widgets:
+            var.trace_add("write", self._invalidate_config_cache)
+
         # Control Buttons Frame
         control_frame = ttk.Frame(left_frame)
         control_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 15))
@@ -340,9 +416,12 @@ class MinecraftLauncherGUI:
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
 
-        # Styled scrolled text with dark theme
-        self.log_text = scrolledtext.ScrolledText(
+        # Styled text with dark theme; append-only, so no undo stack
+        self.log_text = tk.Text(
             log_frame,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             height=20,
             wrap=tk.WORD,
             bg="#1e1e1e",
@@ -354,10 +433,17 @@ class MinecraftLauncherGUI:
             borderwidth=0,
         )
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=2, pady=2)
+        # Colored tags for status lines (used via log(..., tag=...))
+        self.log_text.tag_configure("ok", foreground=self.colors["success"])
+        self.log_text.tag_configure("err", foreground=self.colors["error"])
+        self.log_text.tag_configure("warn", foreground=self.colors["warning"])
+        log_scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
+        log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S), pady=2)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set)
 
         # Log buttons in a frame so they stay visible and aren't cut off
         log_btn_frame = ttk.Frame(log_frame)
-        log_btn_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(8, 2))
+        log_btn_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(8, 2))
         btn_clear = ttk.Button(log_btn_frame, text="Clear Logs", command=self.clear_logs)
         btn_clear.pack(side=tk.LEFT, padx=(0, 5))
         btn_copy = ttk.Button(log_btn_frame, text="Copy all logs", command=self.copy_logs)
@@ -466,9 +552,13 @@ class MinecraftLauncherGUI:
         if not self._monitor_enabled:
             return
 
+        if not self.detected:
+            # Detection still running; nothing to query yet
+            self._monitor_job = self.window.after(2000, self._update_resource_stats)
+            return
+
         try:
             import re
-            import subprocess
 
             # Get container configuration
             config = self._gather_config()
@@ -792,13 +882,13 @@ class MinecraftLauncherGUI:
                                     arcname = f"gamedata/{file_path.relative_to(host_game_dir)}"
                                     zipf.write(file_path, arcname)
 
-            self.log(f"✓ Profile exported to: {save_path}")
+            self.log(f"✓ Profile exported to: {save_path}", tag="ok")
             messagebox.showinfo(
                 "Export Complete", f"Profile exported successfully to:\n{save_path}"
             )
 
         except Exception as e:
-            self.log(f"✗ Export failed: {e}")
+            self.log(f"✗ Export failed: {e}", tag="err")
             messagebox.showerror("Export Failed", f"Failed to export profile:\n{e}")
 
     def import_profile(self):
@@ -904,7 +994,7 @@ class MinecraftLauncherGUI:
                 with open(profiles_file, "w") as f:
                     json.dump(launcher_data, f, indent=2)
 
-            self.log("✓ Profile imported successfully!")
+            self.log("✓ Profile imported successfully!", tag="ok")
             messagebox.showinfo(
                 "Import Complete", f"Profile '{profile_name}' imported successfully!"
             )
@@ -913,7 +1003,7 @@ class MinecraftLauncherGUI:
             self.refresh_profiles()
 
         except Exception as e:
-            self.log(f"✗ Import failed: {e}")
+            self.log(f"✗ Import failed: {e}", tag="err")
             messagebox.showerror("Import Failed", f"Failed to import profile:\n{e}")
 
     def delete_profile(self):
@@ -979,149 +1069,182 @@ class MinecraftLauncherGUI:
             self.refresh_profiles()
 
         except Exception as e:
-            self.log(f"✗ Delete failed: {e}")
+            self.log(f"✗ Delete failed: {e}", tag="err")
             messagebox.showerror("Delete Failed", f"Failed to delete profile:\n{e}")
 
     def _detect_and_load(self):
-        """Detect system and load configuration."""
+        """Detect system and load configuration in a background thread."""
         self.log("Detecting system configuration...")
 
-        # Detect system
-        self.detected = detect_system()
+        # Handlers below need detection results; keep them disabled until it finishes
+        for btn in (self.btn_start, self.btn_doctor, self.btn_save):
+            btn.config(state=tk.DISABLED)
+
+        def detect_worker():
+            try:
+                detected = detect_system()
+                saved = load_config()
+                running = self._is_container_running(detected.get("runtime", "podman"))
+            except Exception as e:
+                self.log(f"\n✗ System detection failed: {e}", tag="err")
+                self.window.after(0, self._on_detection_failed)
+                return
+            self.window.after(0, lambda: self._apply_detection(detected, saved, running))
 
-        # Load saved config
-        saved = load_config()
+        threading.Thread(target=detect_worker, daemon=True).start()
+
+    def _on_detection_failed(self):
+        """Re-enable actions after a failed detection; using one retries detection."""
+        self._update_status("Detection failed", "error", "failed")
+        for btn in (self.btn_start, self.btn_doctor, self.btn_save):
+            btn.config(state=tk.NORMAL)
+
+    def _ensure_detected(self) -> bool:
+        """Return True if detection results are available, else start detecting again."""
+        if self.detected:
+            return True
+        self.log("Retrying system detection; click again when it is ready.", tag="warn")
+        self._detect_and_load()
+        return False
+
+    def _apply_detection(self, detected: Dict[str, str], saved: Dict[str, str], running: bool):
+        """Apply detection results and saved config to the UI (main thread)."""
+        self.detected = detected
+        self._config_cache = None
+        self._detection_details_cache = None
 
         # Merge (saved overrides detection)
         self.config = merge_config(self.detected, saved)
 
+        for btn in (self.btn_start, self.btn_doctor, self.btn_save):
+            btn.config(state=tk.NORMAL)
+
         # Update UI
         self._update_ui_from_config()
 
-        self.log(f"✓ Runtime: {self.detected['runtime']}")
-        self.log(f"✓ GPU: {self.detected['gpu']}")
-        self.log(f"✓ Display: {self.detected['display']}")
-        self.log(f"✓ Audio: {self.detected['audio']}")
+        self.log(f"✓ Runtime: {self.detected['runtime']}", tag="ok")
+        self.log(f"✓ GPU: {self.detected['gpu']}", tag="ok")
+        self.log(f"✓ Display: {self.detected['display']}", tag="ok")
+        self.log(f"✓ Audio: {self.detected['audio']}", tag="ok")
 
-        # Check if container is already running
-        self._check_existing_container()
+        if running:
+            # Container is already running
+            self.log("\n⚠️  Detected existing Minecraft instance!", tag="warn")
+            self.log("Container is already running.")
+            self._update_status("Already Running", "warning", "running")
 
-    def _check_existing_container(self):
-        """Check if the container is already running and update UI accordingly."""
-        try:
-            import subprocess
+            # Disable start button, enable stop button
+            self.btn_start.config(state="disabled")
+            self.btn_stop.config(state="normal")
+            self.btn_restart.config(state="normal")
 
-            runtime = self.detected.get("runtime", "podman")
-            container_name = "tlauncher"
+            # Create manager instance for the running container
+            self.manager = ContainerManager(self.config)
+        else:
+            # Container not running
+            self.log("\n🚀 Ready to start!")
+            self._update_status("Ready", "success", "ready")
 
-            # Check container status
+    @staticmethod
+    def _is_container_running(runtime: str) -> bool:
+        """Check if the tlauncher container is running (blocking; call from a worker)."""
+        container_name = "tlauncher"
+        try:
             result = subprocess.run(
                 [runtime, "ps", "--filter", f"name={container_name}", "--format", "{{.Names}}"],
                 capture_output=True,
                 text=True,
                 timeout=3,
             )
-
-            if result.returncode == 0 and container_name in result.stdout:
-                # Container is already running
-                self.log("\n⚠️  Detected existing Minecraft instance!")
-                self.log("Container is already running.")
-                self._update_status("Already Running", "warning")
-
-                # Disable start button, enable stop button
-                self.btn_start.config(state="disabled")
-                self.btn_stop.config(state="normal")
-                self.btn_restart.config(state="normal")
-
-                # Create manager instance for the running container
-                self.manager = ContainerManager(self.config)
-            else:
-                # Container not running
-                self.log("\n🚀 Ready to start!")
-                self._update_status("Ready", "success")
-
         except Exception:
             # If check fails, assume not running
-            self.log("\n🚀 Ready to start!")
-            self._update_status("Ready", "success")
+            return False
+        return result.returncode == 0 and container_name in result.stdout
 
     def _update_ui_from_config(self):
         """Update UI dropdowns from current config."""
-        self.runtime_var.set(
-            "auto"
-            if not self.config.get("runtime") or self.config["runtime"] == self.detected["runtime"]
-            else self.config["runtime"]
-        )
-        self.gpu_var.set(
-            "auto"
-            if not self.config.get("gpu") or self.config["gpu"] == self.detected["gpu"]
-            else self.config["gpu"]
-        )
-        self.display_var.set(
-            "auto"
-            if not self.config.get("display") or self.config["display"] == self.detected["display"]
-            else self.config["display"]
-        )
-        self.audio_var.set(
-            "auto"
-            if not self.config.get("audio") or self.config["audio"] == self.detected["audio"]
-            else self.config["audio"]
-        )
-
-        # Show detected values only if different from 'auto'
-        self.runtime_status_label.config(
-            text=f"({self.detected['runtime']})" if self.runtime_var.get() == "auto" else ""
-        )
-        self.gpu_status_label.config(
-            text=f"({self.detected['gpu']})" if self.gpu_var.get() == "auto" else ""
-        )
-        self.display_status_label.config(
-            text=f"({self.detected['display']})" if self.display_var.get() == "auto" else ""
-        )
-        self.audio_status_label.config(
-            text=f"({self.detected['audio']})" if self.audio_var.get() == "auto" else ""
-        )
+        label_updates = []
+        for key, var, status_label in self._field_widgets:
+            detected = self.detected[key]
+            value = self.config.get(key) or "auto"
+            is_auto = value in ("auto", detected)
+            var.set("auto" if is_auto else value)
+            # Show detected values only if different from 'auto'
+            label_updates.append((status_label, f"({detected})" if is_auto else ""))
+
+        # Apply all label changes together so Tk does a single relayout pass
+        def apply_labels():
+            for status_label, text in label_updates:
+                status_label.config(text=text)
+
+        self.window.after_idle(apply_labels)
+
+    def _invalidate_config_cache(self, *_args):
+        """Drop the cached UI config (StringVar trace callback)."""
+        self._config_cache = None
 
     def _gather_config(self) -> Dict[str, str]:
-        """Gather configuration from UI."""
-        runtime = self.runtime_var.get()
-        gpu = self.gpu_var.get()
-        display = self.display_var.get()
-        audio = self.audio_var.get()
+        """Gather configuration from UI (cached until a dropdown or detection changes)."""
+        if self._config_cache is None:
+            self._config_cache = self._build_config()
+        return dict(self._config_cache)
 
+    def _build_config(self) -> Dict[str, str]:
+        """Build configuration from the current dropdown values."""
         # Convert 'auto' back to detected values
-        return {
-            "runtime": self.detected["runtime"] if runtime == "auto" else runtime,
-            "gpu": self.detected["gpu"] if gpu == "auto" else gpu,
-            "display": self.detected["display"] if display == "auto" else display,
-            "audio": self.detected["audio"] if audio == "auto" else audio,
-            "auto_xhost": True,
+        config = {
+            key: self.detected[key] if var.get() == "auto" else var.get()
+            for key, var, _label in self._field_widgets
         }
+        config["auto_xhost"] = True
+        return config
 
     def start_minecraft(self):
         """Start button handler."""
-        # Check if already running
+        if not self._ensure_detected():
+            return
+
+        config = self._gather_config()
+
+        # Update UI state; pre-start checks and the container run in a worker thread
+        self._update_status("Starting...", "warning", "starting")
+        self.btn_start.config(state=tk.DISABLED)
+        self.btn_doctor.config(state=tk.DISABLED)
+
+        threading.Thread(target=self._start_worker, args=(config,), daemon=True).start()
+
+    def _start_worker(self, config: Dict[str, str]):
+        """Run pre-start checks and start the container (worker thread)."""
         try:
-            import subprocess
+            self._run_start(config)
+        except Exception as e:
+            self.log(f"\n✗ Failed to start container: {e}", tag="err")
 
-            runtime = self.detected.get("runtime", "podman")
-            result = subprocess.run(
-                [runtime, "ps", "--filter", "name=tlauncher", "--format", "{{.Names}}"],
-                capture_output=True,
-                text=True,
-                timeout=3,
-            )
-            if result.returncode == 0 and "tlauncher" in result.stdout:
-                self.log("\n⚠️  Container is already running!")
+            def _on_start_error():
+                self._update_status("Failed", "error", "failed")
+                self.btn_start.config(state=tk.NORMAL)
+                self.btn_doctor.config(state=tk.NORMAL)
+
+            self.window.after(0, _on_start_error)
+
+    def _run_start(self, config: Dict[str, str]):
+        """Pre-start checks, xhost setup and container launch (called by _start_worker)."""
+        # Check if already running (a failed check counts as not running)
+        if self._is_container_running(self.detected.get("runtime", "podman")):
+            self.log("\n⚠️  Container is already running!", tag="warn")
+
+            def _on_already_running():
+                self._update_status("Already Running", "warning", "running")
+                self.btn_stop.config(state=tk.NORMAL)
+                self.btn_restart.config(state=tk.NORMAL)
+                self.btn_doctor.config(state=tk.NORMAL)
                 messagebox.showinfo(
                     "Already Running",
                     "Minecraft container is already running.\nUse Stop to stop it first.",
                 )
-                return
-        except Exception:
-            pass  # If check fails, continue with start
 
-        config = self._gather_config()
+            self.window.after(0, _on_already_running)
+            return
 
         # Validate
         self.log("\n" + "=" * 50)
@@ -1130,55 +1253,68 @@ class MinecraftLauncherGUI:
 
         if issues:
             for issue in issues:
-                symbol = "✗" if issue.is_blocking() else "⚠"
-                self.log(f"{symbol} {issue.message}")
+                symbol, tag = ("✗", "err") if issue.is_blocking() else ("⚠", "warn")
+                self.log(f"{symbol} {issue.message}", tag=tag)
                 if issue.fix_hint:
                     self.log(f"  → {issue.fix_hint}")
 
         if not valid:
-            self.log("\n✗ Validation failed. Cannot start.")
-            self._update_status("Validation failed", "error")
-            messagebox.showerror(
-                "Validation Failed", "System validation failed. Check the output for details."
-            )
+            self.log("\n✗ Validation failed. Cannot start.", tag="err")
+
+            def _on_validation_failed():
+                self._update_status("Validation failed", "error", "failed")
+                self.btn_start.config(state=tk.NORMAL)
+                self.btn_doctor.config(state=tk.NORMAL)
+                messagebox.showerror(
+                    "Validation Failed", "System validation failed. Check the output for details."
+                )
+
+            self.window.after(0, _on_validation_failed)
             return
 
-        self.log("✓ Validation passed")
+        self.log("✓ Validation passed", tag="ok")
 
         # Run xhost if needed
         if config["display"] == "x11" and config.get("auto_xhost", True):
             self.log("Setting X11 permissions...")
             if run_xhost_if_needed(config):
-                self.log("✓ X11 permissions set")
+                self.log("✓ X11 permissions set", tag="ok")
             else:
-                self.log("⚠ Could not set X11 permissions automatically")
+                self.log("⚠ Could not set X11 permissions automatically", tag="warn")
 
         # Show command
         self.log(f"\nCommand: {get_command_preview(config, 'up')}\n")
 
-        # Update UI state
-        self._update_status("Starting...", "warning")
-        self.btn_start.config(state=tk.DISABLED)
-        self.btn_doctor.config(state=tk.DISABLED)
+        # self.manager is only written on the main thread
+        self.window.after(0, lambda: self._launch_container(config))
+
+    def _launch_container(self, config: Dict[str, str]):
+        """Start the container in a background thread with GUI callbacks (main thread)."""
+        manager = ContainerManager(config)
+        self.manager = manager
+        # A stop that a restart superseded never reached _on_exited to clear this
+        self._user_requested_stop = False
 
-        # Start container in background thread
         def output_callback(line):
             self.log(line)
 
         def started_callback():
             # Launcher GUI is up; run UI update on main thread
             def _on_started():
-                self._update_status("Running", "success")
+                self._update_status("Running", "success", "running")
                 self.btn_stop.config(state=tk.NORMAL)
                 self.btn_restart.config(state=tk.NORMAL)
-                self.log("\n✓ Container started successfully")
+                self.log("\n✓ Container started successfully", tag="ok")
 
             self.window.after(0, _on_started)
 
         def completion_callback(success):
             # Container process exited; run UI update on main thread
             def _on_exited():
-                self._update_status("Stopped", "gray")
+                if self.manager is not manager:
+                    return  # Replaced by a restart; the new run owns the UI state
+                self.manager = None
+                self._update_status("Stopped", "gray", "stopped")
                 self.btn_start.config(state=tk.NORMAL)
                 self.btn_stop.config(state=tk.DISABLED)
                 self.btn_restart.config(state=tk.DISABLED)
@@ -1187,14 +1323,15 @@ class MinecraftLauncherGUI:
                     self._user_requested_stop = False
                     # Don't log "exited with error" — we intentionally stopped it
                 elif success:
-                    self.log("\n✓ Container stopped")
+                    self.log("\n✓ Container stopped", tag="ok")
                 else:
-                    self.log("\n✗ Container exited with error")
+                    self.log("\n✗ Container exited with error", tag="err")
 
             self.window.after(0, _on_exited)
 
         start_container_async(
             config,
+            manager=manager,
             detached=False,
             output_callback=output_callback,
             started_callback=started_callback,
@@ -1204,63 +1341,87 @@ class MinecraftLauncherGUI:
     def stop_minecraft(self):
         """Stop button handler."""
         config = self._gather_config()
+        manager = self.manager or ContainerManager(config)
 
         self._user_requested_stop = True
         self.log("\n" + "=" * 50)
         self.log("Stopping container...")
-        self._update_status("Stopping...", "warning")
+        self._update_status("Stopping...", "warning", "stopping")
+        # Only one stop/restart at a time; re-enabled by _on_stop_done on failure
+        self.btn_stop.config(state=tk.DISABLED)
+        self.btn_restart.config(state=tk.DISABLED)
 
         def stop_worker():
-            manager = ContainerManager(config)
             success = manager.stop()
 
             def _on_stop_done():
                 if success:
-                    self._update_status("Stopped", "gray")
+                    self._update_status("Stopped", "gray", "stopped")
                     self.btn_start.config(state=tk.NORMAL)
                     self.btn_stop.config(state=tk.DISABLED)
                     self.btn_restart.config(state=tk.DISABLED)
                     self.btn_doctor.config(state=tk.NORMAL)
-                    self.log("✓ Container stopped")
+                    self.log("✓ Container stopped", tag="ok")
                 else:
-                    self._update_status("Running", "success")
-                    self.log("✗ Failed to stop container")
+                    self._update_status("Running", "success", "running")
+                    self.btn_stop.config(state=tk.NORMAL)
+                    self.btn_restart.config(state=tk.NORMAL)
+                    self.log("✗ Failed to stop container", tag="err")
 
             self.window.after(0, _on_stop_done)
 
-        threading.Thread(target=stop_worker, daemon=True).start()
+        self._executor.submit(stop_worker)
 
     def restart_minecraft(self):
         """Restart button handler."""
         config = self._gather_config()
+        # Detach the current run so its exit doesn't reset the UI mid-restart
+        manager = self.manager or ContainerManager(config)
+        self.manager = None
 
         self.log("\n" + "=" * 50)
         self.log("Restarting container...")
-        self._update_status("Restarting...", "warning")
+        self._update_status("Restarting...", "warning", "restarting")
+        # Re-enabled by the new run's _on_started or by _on_restart_failed
+        self.btn_stop.config(state=tk.DISABLED)
+        self.btn_restart.config(state=tk.DISABLED)
 
         def restart_worker():
-            manager = ContainerManager(config)
-
-            def output_callback(line):
-                self.log(line)
+            self.log("Stopping container...")
+            if manager.stop():
+                self.log("Starting container...")
+                self.window.after(0, lambda: self._launch_container(config))
+                return
 
-            success = manager.restart(output_callback=output_callback)
+            def _on_restart_failed():
+                self.manager = manager
+                self.btn_stop.config(state=tk.NORMAL)
+                self.btn_restart.config(state=tk.NORMAL)
+                self._update_status("Failed", "error", "failed")
+                self.log("\n✗ Failed to restart container", tag="err")
 
-            if success:
-                self._update_status("Running", "success")
-                self.log("\n✓ Container restarted")
-            else:
-                self._update_status("Failed", "error")
-                self.log("\n✗ Failed to restart container")
+            self.window.after(0, _on_restart_failed)
 
-        threading.Thread(target=restart_worker, daemon=True).start()
+        # Only the stop runs in the pool; the new run streams output on its own thread
+        self._executor.submit(restart_worker)
 
     def run_doctor(self):
         """Doctor button handler - run validation."""
+        if not self._ensure_detected():
+            return
+
         self.log("\n" + "=" * 50)
         self.log("Running system diagnostics...\n")
 
-        details = get_detection_details()
+        # Probing shells out to several tools; reuse very recent results (see DETECTION_CACHE_TTL)
+        now = time.monotonic()
+        if (
+            self._detection_details_cache is None
+            or now - self._detection_details_time > self.DETECTION_CACHE_TTL
+        ):
+            self._detection_details_cache = get_detection_details()
+            self._detection_details_time = now
+        details = self._detection_details_cache
 
         # Show detection details
         rt = details["runtime"]
@@ -1282,133 +1443,167 @@ class MinecraftLauncherGUI:
 
         if issues:
             for issue in issues:
-                symbol = "✗" if issue.is_blocking() else "⚠"
-                self.log(f"{symbol} {issue.message}")
+                symbol, tag = ("✗", "err") if issue.is_blocking() else ("⚠", "warn")
+                self.log(f"{symbol} {issue.message}", tag=tag)
                 if issue.fix_hint:
                     self.log(f"  → {issue.fix_hint}")
         else:
-            self.log("✓ No issues found")
+            self.log("✓ No issues found", tag="ok")
 
         if valid:
-            self.log("\n✓ System ready!")
+            self.log("\n✓ System ready!", tag="ok")
             messagebox.showinfo("System Check", "System is ready to run Minecraft!")
         else:
-            self.log("\n✗ System has errors")
+            self.log("\n✗ System has errors", tag="err")
             messagebox.showwarning(
                 "System Check", "System has validation errors. Check the output for details."
             )
 
     def save_configuration(self):
         """Save current configuration."""
+        if not self._ensure_detected():
+            return
+
         config = self._gather_config()
 
         # Save with 'auto' converted to empty strings
-        save_data = {
-            "runtime": "" if self.runtime_var.get() == "auto" else config["runtime"],
-            "gpu": "" if self.gpu_var.get() == "auto" else config["gpu"],
-            "display": "" if self.display_var.get() == "auto" else config["display"],
-            "audio": "" if self.audio_var.get() == "auto" else config["audio"],
-            "auto_xhost": True,
+        save_data: Dict[str, Any] = {
+            key: "" if var.get() == "auto" else config[key]
+            for key, var, _label in self._field_widgets
         }
+        save_data["auto_xhost"] = True
 
         if save_config(save_data):
-            self.log("\n✓ Configuration saved")
+            self.log("\n✓ Configuration saved", tag="ok")
             messagebox.showinfo("Configuration Saved", "Your configuration has been saved.")
         else:
-            self.log("\n✗ Failed to save configuration")
+            self.log("\n✗ Failed to save configuration", tag="err")
             messagebox.showerror("Save Failed", "Could not save configuration.")
 
     def edit_configuration(self):
         """Open configuration file in text editor."""
-        import os
-        import subprocess
-        from pathlib import Path
-
-        # Get config file path
-        config_dir = Path.home() / ".config" / "minecraft-launcher"
-        config_file = config_dir / "config.yaml"
+        config_file = CONFIG_FILE
 
         # Create config directory if it doesn't exist
-        config_dir.mkdir(parents=True, exist_ok=True)
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
         # Create empty config file if it doesn't exist
         if not config_file.exists():
             config_file.write_text(
                 "# Minecraft Launcher Launcher Configuration\n# Leave values empty to use auto-detection\n\nruntime: ''\ngpu: ''\ndisplay: ''\naudio: ''\nauto_xhost: true\n"
             )
-            self.log("\n✓ Created new config file")
+            self.log("\n✓ Created new config file", tag="ok")
 
-        # Open in default text editor
+        if os.name not in ("posix", "nt"):
+            messagebox.showinfo("Config Location", f"Config file location:\n{config_file}")
+            return
+
+        # Open in default text editor; os.startfile can block while the shell resolves the
+        # file association, so the launch runs in a worker thread
+        threading.Thread(target=self._open_config_file, args=(config_file,), daemon=True).start()
+
+    def _open_config_file(self, config_file: Path):
+        """Launch the platform file opener and report the result (worker thread)."""
         try:
-            if os.name == "posix":  # Linux/Unix
-                subprocess.Popen(["xdg-open", str(config_file)])
-            elif os.name == "nt":  # Windows
+            if os.name == "nt":  # Windows
                 os.startfile(str(config_file))
-            else:
-                messagebox.showinfo("Config Location", f"Config file location:\n{config_file}")
-                return
+            else:  # Linux/Unix
+                # Detached and without our FDs (e.g. the X display socket) or terminal signals
+                subprocess.Popen(
+                    ["xdg-open", str(config_file)],
+                    start_new_session=True,
+                    close_fds=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+        except Exception as e:
+            self.log(f"\n✗ Failed to open config file: {e}", tag="err")
+            message = f"Could not open config file.\nLocation: {config_file}\n\nError: {e}"
+            self.window.after(0, lambda: messagebox.showerror("Failed to Open", message))
+            return
 
-            self.log(f"\n✓ Opening config file: {config_file}")
-            messagebox.showinfo(
+        self.log(f"\n✓ Opening config file: {config_file}", tag="ok")
+        self.window.after(
+            0,
+            lambda: messagebox.showinfo(
                 "Config Editor",
                 f"Opening config file in your default editor:\n{config_file}\n\nEdit and save the file, then restart the launcher to apply changes.",
-            )
-        except Exception as e:
-            self.log(f"\n✗ Failed to open config file: {e}")
-            messagebox.showerror(
-                "Failed to Open",
-                f"Could not open config file.\nLocation: {config_file}\n\nError: {e}",
-            )
+            ),
+        )
 
     def clear_logs(self):
         """Clear the log output."""
         self.log_text.delete("1.0", tk.END)
+        self._log_buffer.clear()
 
     def copy_logs(self):
         """Copy full log content to the clipboard."""
-        content = self.log_text.get("1.0", tk.END)
+        content = "\n".join(self._log_buffer) + "\n"
         if content.strip():
             self.window.clipboard_clear()
             self.window.clipboard_append(content)
             self.window.update_idletasks()
             self.log("(Logs copied to clipboard)")
 
-    def log(self, message: str):
-        """Append message to log output."""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.update()
-
-    def _update_status(self, text: str, color: str = "success"):
-        """Update status label with colored indicator."""
-        # Map color names to actual colors
-        color_map = {
-            "success": self.colors["success"],
-            "green": self.colors["success"],
-            "warning": self.colors["warning"],
-            "orange": self.colors["warning"],
-            "error": self.colors["error"],
-            "red": self.colors["error"],
-            "info": self.colors["info"],
-            "gray": "#888888",
-            "black": self.colors["fg"],
-        }
-
-        actual_color = color_map.get(color, color)
-
-        # Add status indicator dot
-        if "Running" in text:
-            status_text = "● " + text.replace("Status: ", "")
-        elif "Starting" in text or "Stopping" in text or "Restarting" in text:
-            status_text = "◐ " + text.replace("Status: ", "")
-        elif "Stopped" in text or "Ready" in text:
-            status_text = "○ " + text.replace("Status: ", "")
-        elif "Failed" in text or "Error" in text:
-            status_text = "✗ " + text.replace("Status: ", "")
+    def log(self, message: str, tag: Optional[str] = None):
+        """Queue message for the log output; queued lines are flushed in one batch."""
+        self._log_queue.append((message, tag))
+        if self._log_flush_scheduled:
+            return
+        self._log_flush_scheduled = True
+        if threading.current_thread() is threading.main_thread():
+            self.window.after_idle(self._flush_log)
         else:
-            status_text = "● " + text.replace("Status: ", "")
-
-        self.status_label.config(text=status_text, foreground=actual_color)
+            # Called from a worker thread (container output); hand off to the main loop
+            self.window.after(0, self._flush_log)
+
+    def _flush_log(self):
+        """Append all queued log messages, one insert per run of same-tagged lines."""
+        self._log_flush_scheduled = False
+        # (tag, messages) for each run of consecutive messages sharing a tag
+        groups: List[Tuple[Optional[str], List[str]]] = []
+        while self._log_queue:
+            message, tag = self._log_queue.popleft()
+            if groups and groups[-1][0] == tag:
+                groups[-1][1].append(message)
+            else:
+                groups.append((tag, [message]))
+        if not groups:
+            return
+        # Only auto-follow new output if the user hasn't scrolled up to read older lines
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        for tag, msgs in groups:
+            text = "\n".join(msgs)
+            self.log_text.insert(tk.END, text + "\n", (tag,) if tag else ())
+            # Store lines, not messages, so the cap matches the widget's line trim
+            self._log_buffer.extend(text.split("\n"))
+        end_line = int(self.log_text.index("end-1c").split(".")[0])
+        if end_line > self.MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{end_line - self.MAX_LOG_LINES}.0")
+        if at_bottom:
+            self.log_text.yview_moveto(1.0)
+
+        # A steady stream of worker-thread flushes can starve idle redraws;
+        # force a repaint at most every 50 ms so the console keeps up
+        now = time.monotonic()
+        if now - self._last_log_paint > 0.05:
+            self.log_text.update_idletasks()
+            self._last_log_paint = now
+
+    def _update_status(self, text: str, color: str = "success", state: Optional[str] = None):
+        """Update status label with colored indicator (glyph picked by state key)."""
+        actual_color = self._COLOR_MAP.get(color, color)
+        glyph = self._STATUS_GLYPHS.get(state.lower(), "●") if state else "●"
+        self.status_label.config(text=f"{glyph} {text}", foreground=actual_color)
+
+    def _on_close(self):
+        """Window close handler: stop background work and destroy the window."""
+        if self._monitor_job:
+            self.window.after_cancel(self._monitor_job)
+            self._monitor_job = None
+        self._executor.shutdown(wait=False)
+        self.window.destroy()
 
     def run(self):
         """Start the GUI main loop."""